@@ -11,12 +11,27 @@ import argparse
 import random
 import sys
 import time
-import threading
-import io
+import math
+import struct
 from typing import List, Tuple
 
+try:
+    import select
+    import termios
+    import tty
+
+    _HAS_TTY = True
+except ImportError:  # no termios on Windows
+    _HAS_TTY = False
+
 RANKS = "23456789TJQKA"
+RANK_VALUE = {r: i for i, r in enumerate(RANKS)}
 SUITS = "shdc"  # spades, hearts, diamonds, clubs
+SUIT_VALUE = {s: i for i, s in enumerate(SUITS)}
+# Cards are ints: rank index in bits 2..5, suit index in bits 0..1, so the
+# position of a card name in CARD_NAMES is its encoding.
+CARD_NAMES = tuple(r + s for r in RANKS for s in SUITS)
+DECK = bytes(range(52))
 SUIT_SYMBOLS = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
 
 # ANSI color codes for four-color deck (bright colors for dark backgrounds)
@@ -28,159 +43,217 @@ SUIT_COLORS = {
 }
 RESET_COLOR = "\033[0m"
 
+
+def encode(card: str) -> int:
+    """Convert a card like 'As' to its int encoding."""
+    return RANK_VALUE[card[0]] << 2 | SUIT_VALUE[card[1]]
+
+
+def decode(card: int) -> str:
+    """Convert an int-encoded card back to a name like 'As'."""
+    return CARD_NAMES[card]
+
+
 # ------------------------ Range Logic (from user's BTN 45.25% image) --------
 
 
-def rank_value(r: str) -> int:
-    return RANKS.index(r)
+# normalize_cards flag bits
+SUITED = 1
+PAIR = 2
 
 
-def normalize_cards(card1: str, card2: str) -> Tuple[str, str, bool, bool]:
+def normalize_cards(card1: int, card2: int) -> Tuple[int, int, int]:
     """
-    Return (hi_rank, lo_rank, suited, pair) given two cards like 'As','Kd'.
+    Return (hi_rank_index, lo_rank_index, flags) given two int-encoded cards,
+    where flags has SUITED and/or PAIR set.
     """
-    r1, s1 = card1[0], card1[1]
-    r2, s2 = card2[0], card2[1]
-    pair = r1 == r2
-    suited = s1 == s2
-    # sort ranks high->low by rank_value
-    if rank_value(r1) > rank_value(r2):
-        hi, lo = r1, r2
-    else:
-        hi, lo = r2, r1
-    return hi, lo, suited, pair
-
-
-def in_suited_rules(hi: str, lo: str) -> bool:
-    """Apply suited inclusion rules from the user's BTN image."""
-    lo_val = rank_value(lo)
-    # Axs, Kxs, Qxs: all
-    if hi in ("A", "K", "Q"):
-        return True
-    if hi == "J":
-        return lo_val >= rank_value("4")
-    if hi == "T":
-        return lo_val >= rank_value("6")
-    if hi == "9":
-        return lo_val >= rank_value("6")
-    if hi == "8":
-        return lo_val >= rank_value("5")
-    if hi == "7":
-        return lo_val >= rank_value("5")
-    if hi == "6":
-        return lo_val >= rank_value("4")
-    if hi == "5":
-        return lo_val >= rank_value("3")
-    if hi == "4":
-        return lo == "3"  # exactly 43s
-    return False
-
-
-def in_offsuit_rules(hi: str, lo: str) -> bool:
-    """Apply offsuit inclusion rules from the user's BTN image."""
-    # A3o+, K8o+, Q8o+, J8o+, T8o+, plus 98o
-    if hi == "A":
-        return rank_value(lo) >= rank_value("3")
-    if hi == "K":
-        return rank_value(lo) >= rank_value("8")
-    if hi == "Q":
-        return rank_value(lo) >= rank_value("8")
-    if hi == "J":
-        return rank_value(lo) >= rank_value("8")
-    if hi == "T":
-        return rank_value(lo) >= rank_value("8")
-    # special case: 98o
-    return hi == "9" and lo == "8"
-
-
-def is_btn_open_45(card1: str, card2: str) -> bool:
+    r1, r2 = card1 >> 2, card2 >> 2
+    if r1 < r2:
+        r1, r2 = r2, r1
+    flags = ((card1 & 3) == (card2 & 3)) | (r1 == r2) << 1
+    return r1, r2, flags
+
+
+# Lowest kicker opened with each high card, from the user's BTN image.
+# Suited: Axs, Kxs, Qxs, J4s+, T6s+, 96s+, 85s+, 75s+, 64s+, 53s+, 43s
+SUITED_MIN_KICKER = {
+    "A": "2",
+    "K": "2",
+    "Q": "2",
+    "J": "4",
+    "T": "6",
+    "9": "6",
+    "8": "5",
+    "7": "5",
+    "6": "4",
+    "5": "3",
+    "4": "3",
+}
+# Offsuit: A3o+, K8o+, Q8o+, J8o+, T8o+, plus 98o
+OFFSUIT_MIN_KICKER = {
+    "A": "3",
+    "K": "8",
+    "Q": "8",
+    "J": "8",
+    "T": "8",
+    "9": "8",
+}
+
+
+def _build_btn_bitmap() -> int:
+    """Pack the BTN range into one int: bit hi*26 + lo*2 + suited is set for
+    each (hi, lo) rank index pair, pairs included, that is in the range."""
+    bitmap = 0
+    for hi_i in range(len(RANKS)):
+        bitmap |= 1 << (hi_i * 26 + hi_i * 2)  # all pairs 22+
+    for suited, min_kicker in ((1, SUITED_MIN_KICKER), (0, OFFSUIT_MIN_KICKER)):
+        for hi, lo in min_kicker.items():
+            for lo_i in range(RANK_VALUE[lo], RANK_VALUE[hi]):
+                bitmap |= 1 << (RANK_VALUE[hi] * 26 + lo_i * 2 + suited)
+    return bitmap
+
+
+BTN_BITMAP = _build_btn_bitmap()
+
+
+def is_btn_open_45(card1: int, card2: int) -> bool:
     """
-    Return True if two cards are in the 45.25% BTN open range.
+    Return True if two int-encoded cards are in the 45.25% BTN open range.
     """
-    hi, lo, suited, pair = normalize_cards(card1, card2)
-    if pair:
-        return True  # all pairs 22+
-    if suited:
-        return in_suited_rules(hi, lo)
-    else:
-        return in_offsuit_rules(hi, lo)
+    hi, lo, flags = normalize_cards(card1, card2)
+    # distinct cards of one suit are never a pair, so pairs read suited=0
+    return (BTN_BITMAP >> (hi * 26 + lo * 2 + (flags & SUITED))) & 1 == 1
 
 
 # ------------------------ Dealing ------------------------
 
 
-def fresh_deck() -> List[str]:
-    return [r + s for r in RANKS for s in SUITS]
+def fresh_deck() -> List[int]:
+    return list(DECK)
+
+
+# Every two-card combo in the range, so each is dealt with its natural weight
+# (6 per pair, 4 per suited hand, 12 per offsuit hand).
+BTN_COMBOS = [
+    (c1, c2)
+    for i, c1 in enumerate(DECK)
+    for c2 in DECK[i + 1 :]
+    if is_btn_open_45(c1, c2)
+]
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _bounded(rng: random.Random, n: int) -> int:
+    """Uniform int in [0, n) via Lemire's multiply-shift, rejecting rarely."""
+    m = rng.getrandbits(64) * n
+    if m & _MASK64 < n:
+        threshold = (1 << 64) % n
+        while m & _MASK64 < threshold:
+            m = rng.getrandbits(64) * n
+    return m >> 64
+
+
+# Bounds of the 5 partial Fisher-Yates steps over the 50 cards left after
+# the hole cards, and the number of distinct draws they make for one hand.
+_BOARD_BOUNDS = (50, 49, 48, 47, 46)
+_DEAL_OUTCOMES = len(BTN_COMBOS) * 50 * 49 * 48 * 47 * 46
+
+
+def _deal_outcome(w: int) -> Tuple[Tuple[int, int], List[int]]:
+    """Turn a uniform draw in [0, _DEAL_OUTCOMES) into a hand and board."""
+    # Read w as a mixed-radix number: each digit is uniform and independent
+    # of the rest, giving the combo and then the Fisher-Yates partners.
+    w, k = divmod(w, len(BTN_COMBOS))
+    c1, c2 = BTN_COMBOS[k]
+    deck = bytearray(DECK)
+    del deck[c2], deck[c1]  # combos are ordered c1 < c2
+    # partial Fisher-Yates: only the 5 board positions need shuffling
+    for i, bound in enumerate(_BOARD_BOUNDS):
+        w, k = divmod(w, bound)
+        j = i + k
+        deck[i], deck[j] = deck[j], deck[i]
+    return (c1, c2), list(deck[:5])
 
 
 def deal_btn_open_and_board(
-    seed: int | None = None,
-) -> Tuple[Tuple[str, str], List[str]]:
+    rng: random.Random,
+) -> Tuple[Tuple[int, int], List[int]]:
     """Deal a BTN hand from the 45% range, plus a 5-card board."""
-    if seed is not None:
-        random.seed(seed)
-    while True:
-        deck = fresh_deck()
-        random.shuffle(deck)
-        c1, c2 = deck[0], deck[1]
-        if is_btn_open_45(c1, c2):
-            board = deck[2:7]
-            return (c1, c2), board
+    return _deal_outcome(_bounded(rng, _DEAL_OUTCOMES))
+
+
+# 2**64 mod _DEAL_OUTCOMES: batch words whose low product bits fall below
+# this are the biased ones _bounded would reject.
+_DEAL_REJECT_BELOW = (1 << 64) % _DEAL_OUTCOMES
+
+
+def deal_many(
+    n: int, rng: random.Random
+) -> List[Tuple[Tuple[int, int], List[int]]]:
+    """Deal n BTN hands and boards from rng (pre-generated practice sets)."""
+    if n <= 0:
+        return []
+    # Fetch the whole batch's 64-bit words in one call, then map each into
+    # range the same way _bounded does, redrawing the rare rejected word.
+    # Words are read little-endian so a seed deals the same on every host.
+    deals = []
+    for (x,) in struct.iter_unpack("<Q", rng.randbytes(8 * n)):
+        m = x * _DEAL_OUTCOMES
+        if m & _MASK64 < _DEAL_REJECT_BELOW:
+            deals.append(deal_btn_open_and_board(rng))
+        else:
+            deals.append(_deal_outcome(m >> 64))
+    return deals
 
 
 # ------------------------ CLI helpers ------------------------
 
+COUNTDOWN_PREFIX = b"\r\t\t"  # two tabs separation from the street line
+COUNTDOWN_CLEAR = b"\r" + b" " * 20 + b"\r"
+
 
 def wait_for_key_with_timeout(timeout_seconds: int = 600) -> bool:
     """Wait for key press with timeout and countdown display.
     Returns True if key was pressed, False if timeout occurred."""
-    import termios
-    import tty
-    import select
-
-    start_time = time.time()
-    key_pressed = threading.Event()
-
-    def check_keypress():
-        try:
-            fd = sys.stdin.fileno()
-        except io.UnsupportedOperation:
-            return  # In pytest or redirected stdin, just exit the thread
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
-            while not key_pressed.is_set():
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    ch: str = sys.stdin.read(1)
-                    if ch == "\x03":  # Ctrl-C
-                        raise KeyboardInterrupt
-                    if ch.lower() == "q":
-                        raise KeyboardInterrupt
-                    if ch in (" ", "\r", "\n"):
-                        key_pressed.set()
-                        return
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-
-    # Start keypress checking thread
-    key_thread = threading.Thread(target=check_keypress, daemon=True)
-    key_thread.start()
-
-    # Countdown display
-    while time.time() - start_time < timeout_seconds:
-        remaining = timeout_seconds - int(time.time() - start_time)
-        if key_pressed.is_set():
-            # Clear countdown and return
-            print(f"\r{' ' * 20}\r", end="", flush=True)
-            return True
-
-        # Display countdown with two tabs separation
-        print(f"\r\t\t{remaining:2d}s", end="", flush=True)
-        time.sleep(0.1)
-
-    # Timeout reached
-    print(f"\r{' ' * 20}\r", end="", flush=True)
-    return False
+    if timeout_seconds <= 0 or not _HAS_TTY or not sys.stdin.isatty():
+        return False  # In pytest or redirected stdin there is no key to wait for
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    out = sys.stdout.buffer
+    sys.stdout.flush()  # keep earlier print() output ahead of raw writes
+    deadline = time.monotonic() + timeout_seconds
+    last_printed = -1
+    try:
+        tty.setcbreak(fd)
+        while True:
+            wait = deadline - time.monotonic()
+            if wait <= 0:
+                return False
+
+            # Display countdown with two tabs separation
+            remaining = math.ceil(wait)
+            if remaining != last_printed:
+                out.write(COUNTDOWN_PREFIX + b"%2ds" % remaining)
+                out.flush()
+                last_printed = remaining
+
+            # Sleep in select until a key arrives or the display ticks over
+            wait -= remaining - 1
+            if select.select([sys.stdin], [], [], wait)[0]:
+                ch: str = sys.stdin.read(1)
+                # cbreak keeps ISIG, so Ctrl-C arrives as SIGINT, not a char
+                if ch.lower() == "q":
+                    raise KeyboardInterrupt
+                if ch in (" ", "\r", "\n"):
+                    return True
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        # Clear countdown
+        out.write(COUNTDOWN_CLEAR)
+        out.flush()
 
 
 def wait_for_key(
@@ -192,16 +265,29 @@ def wait_for_key(
     wait_for_key_with_timeout()
 
 
-def format_card(card: str) -> str:
-    """Convert a card like 'As' to colored 'A♠'."""
-    rank, suit = card[0], card[1]
-    color = SUIT_COLORS[suit]
-    symbol = SUIT_SYMBOLS[suit]
-    return f"{color}{rank}{symbol}{RESET_COLOR}"
+FORMATTED = tuple(
+    f"{SUIT_COLORS[s]}{r}{SUIT_SYMBOLS[s]}{RESET_COLOR}" for r, s in CARD_NAMES
+)
+
+
+def format_card(card: int) -> str:
+    """Convert an int-encoded card like encode('As') to colored 'A♠'."""
+    return FORMATTED[card]
+
+
+def format_cards(cards: List[int]) -> str:
+    return " ".join(FORMATTED[card] for card in cards)
+
+
+FORMATTED_BYTES = tuple(f.encode() for f in FORMATTED)
 
 
-def format_cards(cards: List[str]) -> str:
-    return " ".join(format_card(card) for card in cards)
+def write_street(label: bytes, cards: List[int]) -> None:
+    """Write a street line straight to stdout's buffer as UTF-8 bytes."""
+    sys.stdout.flush()  # keep earlier print() output ahead of raw writes
+    out = sys.stdout.buffer
+    out.write(label + b" ".join(FORMATTED_BYTES[c] for c in cards) + b"\n")
+    out.flush()
 
 
 def main():
@@ -220,9 +306,8 @@ def main():
     )
     args = parser.parse_args()
 
-    seed = args.seed
     timeout = args.timeout
-    rng = random.Random(seed)
+    rng = random.Random(args.seed)
 
     for i in range(1, args.hands + 1):
         # Generate BB range annotation
@@ -243,26 +328,23 @@ def main():
         stack_depth = int(round(stack_depth / 10) * 10)
         range_str = f"BB Range: {round_half(range_upper)} - {round_half(range_lower)} | Stack: {stack_depth} BBs"
 
-        hand, board = deal_btn_open_and_board(seed=seed)
-        # Increment seed to avoid identical outputs when repeatedly seeding
-        if seed is not None:
-            seed += 1
+        hand, board = deal_btn_open_and_board(rng)
 
         print(f"\nHand {i}:")
         print(range_str)
-        print(f"Preflop: {format_card(hand[0])} {format_card(hand[1])}")
+        write_street(b"Preflop: ", hand)
         wait_for_key_with_timeout(timeout)
 
         flop = board[:3]
-        print(f"Flop:    {format_cards(flop)}")
+        write_street(b"Flop:    ", flop)
         wait_for_key_with_timeout(timeout)
 
-        turn = board[3]
-        print(f"Turn:    {format_card(turn)}")
+        turn = board[3:4]
+        write_street(b"Turn:    ", turn)
         wait_for_key_with_timeout(timeout)
 
-        river = board[4]
-        print(f"River:   {format_card(river)}")
+        river = board[4:]
+        write_street(b"River:   ", river)
         wait_for_key_with_timeout(timeout)
     print("\nDone. Good session.")
 
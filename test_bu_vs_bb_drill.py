@@ -1,5 +1,6 @@
 import bu_vs_bb_drill
 import pytest
+import random
 import sys
 
 
@@ -8,30 +9,153 @@ def test_fresh_deck_len():
     assert len(deck) == 52
 
 
+def test_encode_decode_roundtrip():
+    for i, name in enumerate(bu_vs_bb_drill.CARD_NAMES):
+        assert bu_vs_bb_drill.encode(name) == i
+        assert bu_vs_bb_drill.decode(i) == name
+    assert bu_vs_bb_drill.decode(bu_vs_bb_drill.encode("Td")) == "Td"
+
+
 def test_deal_btn_open_and_board_returns_valid():
-    hand, board = bu_vs_bb_drill.deal_btn_open_and_board(seed=42)
+    hand, board = bu_vs_bb_drill.deal_btn_open_and_board(random.Random(42))
     assert isinstance(hand, tuple)
     assert len(hand) == 2
     assert isinstance(board, list)
     assert len(board) == 5
+    assert bu_vs_bb_drill.is_btn_open_45(*hand)
+    assert len(set(hand) | set(board)) == 7
+
+
+def test_normalize_cards():
+    e = bu_vs_bb_drill.encode
+    suited, pair = bu_vs_bb_drill.SUITED, bu_vs_bb_drill.PAIR
+    assert bu_vs_bb_drill.normalize_cards(e("Ks"), e("As")) == (12, 11, suited)
+    assert bu_vs_bb_drill.normalize_cards(e("7h"), e("Td")) == (8, 5, 0)
+    assert bu_vs_bb_drill.normalize_cards(e("2c"), e("2d")) == (0, 0, pair)
+
+
+def test_is_btn_open_45():
+    def in_range(c1, c2):
+        e = bu_vs_bb_drill.encode
+        assert bu_vs_bb_drill.is_btn_open_45(e(c1), e(c2)) == (
+            bu_vs_bb_drill.is_btn_open_45(e(c2), e(c1))
+        )
+        return bu_vs_bb_drill.is_btn_open_45(e(c1), e(c2))
+
+    for c1, c2 in [("2s", "2h"), ("Ah", "2h"), ("4d", "3d"), ("9c", "8h")]:
+        assert in_range(c1, c2)
+    for c1, c2 in [("Ah", "2d"), ("4d", "2d"), ("9c", "7h"), ("Jh", "3h")]:
+        assert not in_range(c1, c2)
+
+
+def test_btn_bitmap_matches_original_rules():
+    # Value the original in_suited_rules/in_offsuit_rules chains produced
+    assert bu_vs_bb_drill.BTN_BITMAP == (
+        0x1FFFFFE1FFEAA81FFAAA01FEA8001FA00001E800001A800001A000001A000001A00000180000010000001
+    )
+
+
+def test_btn_range_combo_count():
+    # 78 pair + 57 * 4 suited + 26 * 12 offsuit combos
+    assert len(bu_vs_bb_drill.BTN_COMBOS) == 618
+
+
+def test_bounded_in_range():
+    rng = random.Random(0)
+    assert all(bu_vs_bb_drill._bounded(rng, 1) == 0 for _ in range(100))
+    draws = {bu_vs_bb_drill._bounded(rng, 5) for _ in range(1000)}
+    assert draws == set(range(5))
+
+
+class StubRng:
+    """Hands out fixed 64-bit words from getrandbits/randbytes."""
+
+    def __init__(self, words):
+        self.words = list(words)
+
+    def getrandbits(self, k):
+        return self.words.pop(0)
+
+    def randbytes(self, n):
+        words = [self.words.pop(0) for _ in range(n // 8)]
+        return b"".join(w.to_bytes(8, "little") for w in words)
+
+
+def test_bounded_rejects_biased_word():
+    # 2**64 % 3 == 1, so word 0 (low product bits 0) is biased and redrawn
+    rng = StubRng([0, 1 << 63])
+    assert bu_vs_bb_drill._bounded(rng, 3) == 1
+    assert rng.words == []
+
+
+def test_deal_many_matches_single_deals():
+    word = 0x0123456789ABCDEF
+    single = bu_vs_bb_drill.deal_btn_open_and_board(StubRng([word]))
+    assert bu_vs_bb_drill.deal_many(1, StubRng([word])) == [single]
+    # word 0 is biased for _DEAL_OUTCOMES, so both paths move on to the next
+    first = bu_vs_bb_drill.deal_btn_open_and_board(StubRng([0, word]))
+    assert first == single
+    assert bu_vs_bb_drill.deal_many(1, StubRng([0, word])) == [single]
+
+
+def test_deal_many_empty():
+    assert bu_vs_bb_drill.deal_many(0, random.Random(1)) == []
+    assert bu_vs_bb_drill.deal_many(-1, random.Random(1)) == []
+
+
+def test_deal_many():
+    deals = bu_vs_bb_drill.deal_many(200, random.Random(7))
+    assert len(deals) == 200
+    for hand, board in deals:
+        assert bu_vs_bb_drill.is_btn_open_45(*hand)
+        assert len(set(hand) | set(board)) == 7
+    assert deals == bu_vs_bb_drill.deal_many(200, random.Random(7))
+
+
+def _chi_square_vs_range(hands):
+    """Chi-square of the hands' high-rank histogram against BTN_COMBOS."""
+    expected = [0] * 13
+    for c1, c2 in bu_vs_bb_drill.BTN_COMBOS:
+        expected[max(c1, c2) >> 2] += len(hands) / len(bu_vs_bb_drill.BTN_COMBOS)
+    observed = [0] * 13
+    for c1, c2 in hands:
+        observed[max(c1, c2) >> 2] += 1
+    return sum((o - e) ** 2 / e for o, e in zip(observed, expected))
+
+
+def test_deal_paths_match_range_distribution():
+    # 12 degrees of freedom: 32.9 is the p = 0.001 critical value
+    rng = random.Random(11)
+    batch = [hand for hand, _ in bu_vs_bb_drill.deal_many(20000, rng)]
+    single = [
+        bu_vs_bb_drill.deal_btn_open_and_board(rng)[0] for _ in range(20000)
+    ]
+    assert _chi_square_vs_range(batch) < 32.9
+    assert _chi_square_vs_range(single) < 32.9
 
 
 def test_format_card_output():
-    card = "As"
+    card = bu_vs_bb_drill.encode("As")
     out = bu_vs_bb_drill.format_card(card)
     assert "A" in out and ("\u2660" in out or "♠" in out)
 
 
 def test_format_cards_output():
-    cards = ["As", "Kd", "7h"]
+    cards = [bu_vs_bb_drill.encode(c) for c in ["As", "Kd", "7h"]]
     out = bu_vs_bb_drill.format_cards(cards)
     # Check that each rank appears at least once
     for rank in ["A", "K", "7"]:
         assert rank in out
 
 
-def test_main_runs(monkeypatch: pytest.MonkeyPatch):
+def test_main_runs(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
     # Patch input to simulate quick ENTER presses
     monkeypatch.setattr("sys.stdin.read", lambda n=1: "\n")
     monkeypatch.setattr(sys, "argv", ["prog", "1", "--timeout", "0"])
     bu_vs_bb_drill.main()
+    out = capsys.readouterr().out
+    streets = ["Hand 1:", "Preflop:", "Flop:", "Turn:", "River:", "Done."]
+    positions = [out.index(s) for s in streets]
+    assert positions == sorted(positions)